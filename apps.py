@@ -3,43 +3,339 @@
 #  Uses only os, subprocess, and ctypes — zero third-party deps
 # ============================================================
 
+import ctypes
+import ctypes.wintypes as wt
+import datetime
 import os
 import subprocess
 import sys
+from functools import lru_cache
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 import config
 
 
+@lru_cache(maxsize=128)
+def _normalize(name: str) -> str:
+    """Lower-case + strip a spoken app/folder name (cached per distinct name)."""
+    return name.strip().lower()
+
+
+# ── App launching ─────────────────────────────────────────────
+_CREATE_NEW_CONSOLE         = 0x00000010
+_CREATE_NEW_PROCESS_GROUP   = 0x00000200
+_CREATE_BREAKAWAY_FROM_JOB  = 0x01000000
+_SPAWN_FLAGS = _CREATE_NEW_CONSOLE | _CREATE_NEW_PROCESS_GROUP if sys.platform == "win32" else 0
+
+
+def _launch_kind(command: str) -> str:
+    """Classify an APP_COMMANDS entry once: "uri" for shell URIs, "exe" otherwise."""
+    return "uri" if command.startswith(("ms-", "http")) else "exe"
+
+
+def _spawn(path: str):
+    """
+    Launch `path` directly with CreateProcess — no cmd.exe in between.
+    The list form lets subprocess quote paths that contain spaces.
+
+    No std handles are redirected: the app gets its own console (or none,
+    for GUI apps), so with close_fds=True CreateProcess runs with
+    bInheritHandles=FALSE — nothing to open, list, or inherit.
+    """
+    popen_kwargs = dict(shell=False, close_fds=True)
+    args = [os.path.normpath(path)]
+    try:
+        # Break away from our job object so the app outlives NEXIS
+        subprocess.Popen(args, creationflags=_SPAWN_FLAGS | _CREATE_BREAKAWAY_FROM_JOB, **popen_kwargs)
+    except PermissionError:
+        # The job we're in forbids breakaway (e.g. some terminals) — launch normally
+        subprocess.Popen(args, creationflags=_SPAWN_FLAGS, **popen_kwargs)
+
+
+# ── Win32 virtual-key codes for the media volume keys ─────────
+_VK_VOLUME_MUTE   = 0xAD
+_VK_VOLUME_DOWN   = 0xAE
+_VK_VOLUME_UP     = 0xAF
+_KEYEVENTF_KEYUP  = 0x0002
+
+# direction → (virtual key, presses, spoken confirmation)
+_VOLUME_ACTIONS = {
+    "up"   : (_VK_VOLUME_UP,   5, "Volume increased."),
+    "down" : (_VK_VOLUME_DOWN, 5, "Volume decreased."),
+    "mute" : (_VK_VOLUME_MUTE, 1, "Audio muted / unmuted."),
+}
+
+
+# ── Win32 shutdown privilege ──────────────────────────────────
+_TOKEN_ADJUST_PRIVILEGES = 0x0020
+_TOKEN_QUERY             = 0x0008
+_SE_PRIVILEGE_ENABLED    = 0x00000002
+_SE_SHUTDOWN_NAME        = "SeShutdownPrivilege"
+
+
+class _LUID(ctypes.Structure):
+    _fields_ = [("LowPart", wt.DWORD), ("HighPart", wt.LONG)]
+
+
+class _LUID_AND_ATTRIBUTES(ctypes.Structure):
+    _fields_ = [("Luid", _LUID), ("Attributes", wt.DWORD)]
+
+
+class _TOKEN_PRIVILEGES(ctypes.Structure):
+    _fields_ = [("PrivilegeCount", wt.DWORD), ("Privileges", _LUID_AND_ATTRIBUTES * 1)]
+
+
+def _enable_shutdown_privilege():
+    """Grant this process SE_SHUTDOWN_NAME so InitiateSystemShutdownExW is allowed."""
+    token = wt.HANDLE()
+    if not _advapi32.OpenProcessToken(_kernel32.GetCurrentProcess(),
+                                     _TOKEN_ADJUST_PRIVILEGES | _TOKEN_QUERY, ctypes.byref(token)):
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        privileges = _TOKEN_PRIVILEGES(1)
+        privileges.Privileges[0].Attributes = _SE_PRIVILEGE_ENABLED
+        if not _advapi32.LookupPrivilegeValueW(None, _SE_SHUTDOWN_NAME,
+                                               ctypes.byref(privileges.Privileges[0].Luid)):
+            raise ctypes.WinError(ctypes.get_last_error())
+        ok  = _advapi32.AdjustTokenPrivileges(token, False, ctypes.byref(privileges), 0, None, None)
+        err = ctypes.get_last_error()
+        # A non-zero return can still mean ERROR_NOT_ALL_ASSIGNED
+        if not ok or err != 0:
+            raise ctypes.WinError(err)
+    finally:
+        _kernel32.CloseHandle(token)
+
+
+def _initiate_shutdown(reboot: bool, timeout: int = 10):
+    """Schedule a forced shutdown/restart in `timeout` seconds (same as `shutdown /s|/r /t 10`)."""
+    _enable_shutdown_privilege()
+    if not _advapi32.InitiateSystemShutdownExW(None, None, timeout, True, reboot, 0):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+
+# ── Win32 process enumeration / termination ──────────────────
+_TH32CS_SNAPPROCESS                = 0x00000002
+_PROCESS_TERMINATE                 = 0x0001
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_INVALID_HANDLE                    = wt.HANDLE(-1).value
+
+
+class _PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize",              wt.DWORD),
+        ("cntUsage",            wt.DWORD),
+        ("th32ProcessID",       wt.DWORD),
+        ("th32DefaultHeapID",   ctypes.c_size_t),
+        ("th32ModuleID",        wt.DWORD),
+        ("cntThreads",          wt.DWORD),
+        ("th32ParentProcessID", wt.DWORD),
+        ("pcPriClassBase",      wt.LONG),
+        ("dwFlags",             wt.DWORD),
+        ("szExeFile",           wt.WCHAR * wt.MAX_PATH),
+    ]
+
+
+def _list_processes() -> list[tuple[int, int, str]]:
+    """Return (pid, parent_pid, exe_name) for every running process."""
+    snapshot = _kernel32.CreateToolhelp32Snapshot(_TH32CS_SNAPPROCESS, 0)
+    if snapshot == _INVALID_HANDLE:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        entry = _PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(_PROCESSENTRY32W)
+        procs = []
+        ok = _kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while ok:
+            procs.append((entry.th32ProcessID, entry.th32ParentProcessID, entry.szExeFile))
+            ok = _kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+        return procs
+    finally:
+        _kernel32.CloseHandle(snapshot)
+
+
+def _process_created(pid: int) -> int | None:
+    """Creation time of `pid` as a FILETIME integer, or None if it can't be read."""
+    handle = _kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
+    try:
+        created, exited, kernel, user = wt.FILETIME(), wt.FILETIME(), wt.FILETIME(), wt.FILETIME()
+        if not _kernel32.GetProcessTimes(handle, ctypes.byref(created), ctypes.byref(exited),
+                                         ctypes.byref(kernel), ctypes.byref(user)):
+            return None
+        return (created.dwHighDateTime << 32) | created.dwLowDateTime
+    finally:
+        _kernel32.CloseHandle(handle)
+
+
+def _kill_process_tree(image_name: str) -> int:
+    """
+    Force-kill every process named `image_name` plus its descendants
+    (equivalent to `taskkill /F /IM <image_name> /T`).
+    Returns the number of processes terminated.
+    """
+    procs    = _list_processes()
+    image    = image_name.lower()
+    targets  = [pid for pid, _, exe in procs if exe.lower() == image]
+    children = {}
+    for pid, ppid, _ in procs:
+        children.setdefault(ppid, []).append(pid)
+
+    # Walk th32ParentProcessID links to collect the whole tree (/T).
+    # That field is never cleared when the parent exits and PIDs are
+    # reused, so an orphan (e.g. explorer.exe) can name a PID that now
+    # belongs to a target. Only a child created after its parent is real.
+    created = {}
+
+    def created_at(pid):
+        if pid not in created:
+            created[pid] = _process_created(pid)
+        return created[pid]
+
+    tree, stack = [], list(targets)
+    seen = set()
+    while stack:
+        pid = stack.pop()
+        if pid in seen or pid == 0:
+            continue
+        seen.add(pid)
+        tree.append(pid)
+        parent_time = created_at(pid)
+        if parent_time is None:
+            continue   # can't prove any link — kill this one only
+        for child in children.get(pid, ()):
+            child_time = created_at(child)
+            if child_time is not None and child_time > parent_time:
+                stack.append(child)
+
+    killed = 0
+    for pid in tree:
+        handle = _kernel32.OpenProcess(_PROCESS_TERMINATE, False, pid)
+        if not handle:
+            continue
+        try:
+            if _kernel32.TerminateProcess(handle, 1):
+                killed += 1
+        finally:
+            _kernel32.CloseHandle(handle)
+    return killed
+
+
+# ── Win32 / GDI+ bindings for screenshots ─────────────────────
+_SRCCOPY = 0x00CC0020
+
+
+class _GdiplusStartupInput(ctypes.Structure):
+    _fields_ = [
+        ("GdiplusVersion",           wt.UINT),
+        ("DebugEventCallback",       ctypes.c_void_p),
+        ("SuppressBackgroundThread", wt.BOOL),
+        ("SuppressExternalCodecs",   wt.BOOL),
+    ]
+
+
+class _GUID(ctypes.Structure):
+    _fields_ = [
+        ("Data1", wt.DWORD),
+        ("Data2", wt.WORD),
+        ("Data3", wt.WORD),
+        ("Data4", ctypes.c_ubyte * 8),
+    ]
+
+
+# {557CF406-1A04-11D3-9A73-0000F81EF32E} — GDI+ built-in PNG encoder
+_PNG_ENCODER = _GUID(0x557CF406, 0x1A04, 0x11D3,
+                     (ctypes.c_ubyte * 8)(0x9A, 0x73, 0x00, 0x00, 0xF8, 0x1E, 0xF3, 0x2E))
+
+
+# ── Private DLL handles with prototypes declared once ─────────
+# Own WinDLL instances, so these argtypes never touch the shared
+# ctypes.windll objects; use_last_error makes ctypes.get_last_error()
+# report the error of the call itself.
+if sys.platform == "win32":
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _advapi32 = ctypes.WinDLL("advapi32", use_last_error=True)
+    _user32   = ctypes.WinDLL("user32",   use_last_error=True)
+    _gdi32    = ctypes.WinDLL("gdi32",    use_last_error=True)
+    _gdiplus  = ctypes.WinDLL("gdiplus")
+    _powrprof = ctypes.WinDLL("powrprof", use_last_error=True)
+
+    _kernel32.GetCurrentProcess.restype          = wt.HANDLE
+    _kernel32.CloseHandle.argtypes               = [wt.HANDLE]
+    _kernel32.CreateToolhelp32Snapshot.argtypes  = [wt.DWORD, wt.DWORD]
+    _kernel32.CreateToolhelp32Snapshot.restype   = wt.HANDLE
+    _kernel32.Process32FirstW.argtypes           = [wt.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)]
+    _kernel32.Process32NextW.argtypes            = [wt.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)]
+    _kernel32.OpenProcess.argtypes               = [wt.DWORD, wt.BOOL, wt.DWORD]
+    _kernel32.OpenProcess.restype                = wt.HANDLE
+    _kernel32.TerminateProcess.argtypes          = [wt.HANDLE, wt.UINT]
+    _kernel32.GetProcessTimes.argtypes           = [wt.HANDLE] + [ctypes.POINTER(wt.FILETIME)] * 4
+
+    _advapi32.OpenProcessToken.argtypes          = [wt.HANDLE, wt.DWORD, ctypes.POINTER(wt.HANDLE)]
+    _advapi32.LookupPrivilegeValueW.argtypes     = [wt.LPCWSTR, wt.LPCWSTR, ctypes.POINTER(_LUID)]
+    _advapi32.AdjustTokenPrivileges.argtypes     = [wt.HANDLE, wt.BOOL, ctypes.POINTER(_TOKEN_PRIVILEGES),
+                                                    wt.DWORD, ctypes.c_void_p, ctypes.c_void_p]
+    _advapi32.InitiateSystemShutdownExW.argtypes = [wt.LPWSTR, wt.LPWSTR, wt.DWORD, wt.BOOL, wt.BOOL, wt.DWORD]
+
+    _user32.LockWorkStation.argtypes             = []
+    _user32.GetSystemMetrics.argtypes            = [ctypes.c_int]
+    _user32.GetDC.argtypes                       = [wt.HWND]
+    _user32.GetDC.restype                        = wt.HDC
+    _user32.ReleaseDC.argtypes                   = [wt.HWND, wt.HDC]
+    _user32.keybd_event.argtypes                 = [ctypes.c_ubyte, ctypes.c_ubyte, wt.DWORD, ctypes.c_size_t]
+    _user32.keybd_event.restype                  = None
+
+    _gdi32.CreateCompatibleDC.argtypes           = [wt.HDC]
+    _gdi32.CreateCompatibleDC.restype            = wt.HDC
+    _gdi32.CreateCompatibleBitmap.argtypes       = [wt.HDC, ctypes.c_int, ctypes.c_int]
+    _gdi32.CreateCompatibleBitmap.restype        = wt.HBITMAP
+    _gdi32.SelectObject.argtypes                 = [wt.HDC, wt.HGDIOBJ]
+    _gdi32.SelectObject.restype                  = wt.HGDIOBJ
+    _gdi32.BitBlt.argtypes                       = [wt.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                                                    wt.HDC, ctypes.c_int, ctypes.c_int, wt.DWORD]
+    _gdi32.DeleteObject.argtypes                 = [wt.HGDIOBJ]
+    _gdi32.DeleteDC.argtypes                     = [wt.HDC]
+
+    _gdiplus.GdiplusStartup.argtypes             = [ctypes.POINTER(ctypes.c_size_t),
+                                                    ctypes.POINTER(_GdiplusStartupInput), ctypes.c_void_p]
+    _gdiplus.GdipCreateBitmapFromHBITMAP.argtypes = [wt.HBITMAP, wt.HPALETTE, ctypes.POINTER(ctypes.c_void_p)]
+    _gdiplus.GdipSaveImageToFile.argtypes        = [ctypes.c_void_p, wt.LPCWSTR, ctypes.POINTER(_GUID), ctypes.c_void_p]
+    _gdiplus.GdipDisposeImage.argtypes           = [ctypes.c_void_p]
+
+    _powrprof.SetSuspendState.argtypes           = [wt.BOOLEAN, wt.BOOLEAN, wt.BOOLEAN]
+    _powrprof.SetSuspendState.restype            = wt.BOOLEAN
+
+
 class AppController:
     """
     Handles opening/closing applications and folders on Windows.
     All commands use built-in Windows mechanisms — no extra libraries.
     """
 
+    # GDI+ is started once per process, on the first screenshot
+    _gdiplus_token = None
+
+    def __init__(self):
+        # Build lookup tables once — keys lower-cased, paths env-expanded
+        # (e.g. %USERNAME%) so each command is a single dict lookup.
+        # Apps are pre-tagged: "uri" (ms-settings:, http…) → os.startfile,
+        # "exe" → _spawn.
+        self._apps    = {k.lower(): (_launch_kind(v), os.path.expandvars(v)) for k, v in config.APP_COMMANDS.items()}
+        self._folders = {k.lower(): os.path.expandvars(v) for k, v in config.FOLDER_COMMANDS.items()}
+        self._procs   = {k.lower(): v for k, v in config.PROCESS_NAMES.items()}
+        # %USERPROFILE% is fixed for the life of the process
+        self._desktop = os.path.join(os.environ.get("USERPROFILE", os.path.expanduser("~")), "Desktop")
+
     # ── Open an application ──────────────────────────────────
     def open_app(self, app_name: str) -> str:
-        app_name_lower = app_name.lower()
-        path = config.APP_COMMANDS.get(app_name_lower)
+        entry = self._apps.get(_normalize(app_name))
 
-        if not path:
+        if not entry:
             return f"I don't have a shortcut for '{app_name}'. You can add it to config.py."
 
-        # Expand environment variables like %USERNAME%
-        path = os.path.expandvars(path)
-
+        kind, path = entry
         try:
             # "ms-settings:" style URIs need os.startfile
-            if path.startswith("ms-"):
-                os.startfile(path)
-            else:
-                subprocess.Popen(
-                    path,
-                    shell              = True,   # shell=True handles spaces in paths
-                    creationflags      = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
-                    stdout             = subprocess.DEVNULL,
-                    stderr             = subprocess.DEVNULL,
-                )
+            (os.startfile if kind == "uri" else _spawn)(path)
             return f"Opening {app_name}."
         except FileNotFoundError:
             return (f"Couldn't find '{app_name}'. "
@@ -49,20 +345,13 @@ class AppController:
 
     # ── Close an application ─────────────────────────────────
     def close_app(self, app_name: str) -> str:
-        app_name_lower = app_name.lower()
-        process = config.PROCESS_NAMES.get(app_name_lower)
+        process = self._procs.get(_normalize(app_name))
 
         if not process:
             return f"I don't know the process name for '{app_name}'. Add it to config.py."
 
         try:
-            # /F = force-kill, /IM = by image name, /T = include children
-            result = subprocess.run(
-                ["taskkill", "/F", "/IM", process, "/T"],
-                capture_output = True,
-                text           = True,
-            )
-            if result.returncode == 0:
+            if _kill_process_tree(process):
                 return f"Closed {app_name}."
             else:
                 return f"{app_name} doesn't seem to be running."
@@ -71,14 +360,11 @@ class AppController:
 
     # ── Open a folder ─────────────────────────────────────────
     def open_folder(self, folder_name: str) -> str:
-        folder_name_lower = folder_name.lower()
-        path = config.FOLDER_COMMANDS.get(folder_name_lower)
+        path = self._folders.get(_normalize(folder_name))
 
         if not path:
             return f"I don't have a shortcut for the '{folder_name}' folder."
 
-        path = os.path.expandvars(path)
-
         try:
             os.startfile(path)   # Opens in File Explorer
             return f"Opening your {folder_name} folder."
@@ -88,77 +374,89 @@ class AppController:
     # ── System controls ───────────────────────────────────────
     def lock_screen(self) -> str:
         try:
-            subprocess.run(["rundll32.exe", "user32.dll,LockWorkStation"])
+            if not _user32.LockWorkStation():
+                raise ctypes.WinError(ctypes.get_last_error())
             return "Screen locked."
         except Exception as e:
             return f"Couldn't lock screen: {e}"
 
     def shutdown_pc(self) -> str:
         try:
-            subprocess.run(["shutdown", "/s", "/t", "10"])
+            _initiate_shutdown(reboot=False)
             return "PC will shut down in 10 seconds. Say 'cancel shutdown' to abort."
         except Exception as e:
             return f"Couldn't initiate shutdown: {e}"
 
     def restart_pc(self) -> str:
         try:
-            subprocess.run(["shutdown", "/r", "/t", "10"])
+            _initiate_shutdown(reboot=True)
             return "PC will restart in 10 seconds."
         except Exception as e:
             return f"Couldn't initiate restart: {e}"
 
     def sleep_pc(self) -> str:
         try:
-            subprocess.run(["rundll32.exe", "powrprof.dll,SetSuspendState", "0,1,0"])
+            _powrprof.SetSuspendState(False, True, False)   # hibernate=0, force=1, wake events on
             return "Putting the PC to sleep."
         except Exception as e:
             return f"Couldn't sleep: {e}"
 
+    @classmethod
+    def _start_gdiplus(cls):
+        """Initialise GDI+ once and cache the token on the class."""
+        if cls._gdiplus_token is None:
+            token   = ctypes.c_size_t()
+            startup = _GdiplusStartupInput(1, None, False, False)
+            status  = _gdiplus.GdiplusStartup(ctypes.byref(token), ctypes.byref(startup), None)
+            if status != 0:
+                raise OSError(f"GdiplusStartup failed (status {status})")
+            cls._gdiplus_token = token
+
     def take_screenshot(self) -> str:
         """Save screenshot to Desktop using the built-in Win32 API via ctypes."""
         try:
-            # Use PowerShell's built-in screenshot capability — no extra deps
-            desktop = os.path.expandvars(r"%USERPROFILE%\Desktop")
-            filename = f"screenshot_{__import__('datetime').datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-            filepath = os.path.join(desktop, filename)
-            ps_cmd = (
-                f"Add-Type -AssemblyName System.Windows.Forms; "
-                f"$s=[System.Windows.Forms.Screen]::PrimaryScreen.Bounds; "
-                f"$b=New-Object System.Drawing.Bitmap($s.Width,$s.Height); "
-                f"$g=[System.Drawing.Graphics]::FromImage($b); "
-                f"$g.CopyFromScreen($s.Location,[System.Drawing.Point]::Empty,$s.Size); "
-                f"$b.Save('{filepath}'); $g.Dispose(); $b.Dispose()"
-            )
-            subprocess.run(
-                ["powershell", "-Command", ps_cmd],
-                capture_output=True
-            )
+            n = datetime.datetime.now()   # plain field formatting — no strftime/locale lookup
+            filename = (f"screenshot_{n.year:04d}{n.month:02d}{n.day:02d}_"
+                        f"{n.hour:02d}{n.minute:02d}{n.second:02d}.png")
+            filepath = os.path.join(self._desktop, filename)
+
+            self._start_gdiplus()
+            # GetDC → CreateCompatibleBitmap → BitBlt → GdipSaveImageToFile
+            width, height = _user32.GetSystemMetrics(0), _user32.GetSystemMetrics(1)
+            screen_dc = _user32.GetDC(None)
+            mem_dc    = _gdi32.CreateCompatibleDC(screen_dc)
+            bitmap    = _gdi32.CreateCompatibleBitmap(screen_dc, width, height)
+            image     = ctypes.c_void_p()
+            try:
+                previous = _gdi32.SelectObject(mem_dc, bitmap)
+                _gdi32.BitBlt(mem_dc, 0, 0, width, height, screen_dc, 0, 0, _SRCCOPY)
+                _gdi32.SelectObject(mem_dc, previous)
+
+                status = _gdiplus.GdipCreateBitmapFromHBITMAP(bitmap, None, ctypes.byref(image))
+                if status == 0:
+                    status = _gdiplus.GdipSaveImageToFile(image, filepath, ctypes.byref(_PNG_ENCODER), None)
+                if status != 0:
+                    return f"Screenshot failed: GDI+ status {status}."
+            finally:
+                if image:
+                    _gdiplus.GdipDisposeImage(image)
+                _gdi32.DeleteObject(bitmap)
+                _gdi32.DeleteDC(mem_dc)
+                _user32.ReleaseDC(None, screen_dc)
             return f"Screenshot saved to Desktop as {filename}."
         except Exception as e:
             return f"Screenshot failed: {e}"
 
     def volume_change(self, direction: str) -> str:
         """
-        Adjust system volume using NirCmd (if installed) or PowerShell.
+        Adjust system volume by pressing the media volume keys via user32.
         direction: "up" | "down" | "mute"
         """
         try:
-            # Uses PowerShell + Windows Audio COM object — no NirCmd needed
-            if direction == "up":
-                script = "(New-Object -com WScript.Shell).SendKeys([char]175)"   # VK_VOLUME_UP  ×5
-                script = "(1..5) | % { (New-Object -com WScript.Shell).SendKeys([char]175) }"
-            elif direction == "down":
-                script = "(1..5) | % { (New-Object -com WScript.Shell).SendKeys([char]174) }"
-            else:  # mute
-                script = "(New-Object -com WScript.Shell).SendKeys([char]173)"
-
-            subprocess.run(["powershell", "-Command", script], capture_output=True)
-
-            if direction == "up":
-                return "Volume increased."
-            elif direction == "down":
-                return "Volume decreased."
-            else:
-                return "Audio muted / unmuted."
+            vk, presses, message = _VOLUME_ACTIONS.get(direction, _VOLUME_ACTIONS["mute"])
+            for _ in range(presses):
+                _user32.keybd_event(vk, 0, 0, 0)
+                _user32.keybd_event(vk, 0, _KEYEVENTF_KEYUP, 0)
+            return message
         except Exception as e:
             return f"Volume control failed: {e}"
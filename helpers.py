@@ -6,6 +6,7 @@ import re
 import os
 import sys
 import datetime
+from functools import lru_cache
 
 
 def clear_screen():
@@ -13,18 +14,30 @@ def clear_screen():
     os.system("cls" if sys.platform == "win32" else "clear")
 
 
+_BANNER_RULE = "─" * 56
+_BANNER_TAIL = (
+    f"{_BANNER_RULE}\n\n"
+    "  Say 'exit' or 'bye' to quit.\n"
+    "  Say 'help' to see what I can do.\n\n"
+    f"{_BANNER_RULE}\n"
+)
+
+
+@lru_cache(maxsize=1)
+def _banner_date() -> str:
+    """Startup date line — formatted once per run."""
+    return datetime.datetime.now().strftime('%A, %B %d %Y  %I:%M %p')
+
+
 def print_banner(name: str):
-    """Print a startup banner."""
-    width = 56
-    line  = "─" * width
-    print(f"\n{'─' * width}")
-    print(f"  🤖  {name} — AI Voice Assistant")
-    print(f"  ⚡  Powered by free & open-source libraries")
-    print(f"  📅  {datetime.datetime.now().strftime('%A, %B %d %Y  %I:%M %p')}")
-    print(f"{'─' * width}\n")
-    print("  Say 'exit' or 'bye' to quit.")
-    print("  Say 'help' to see what I can do.\n")
-    print(f"{'─' * width}\n")
+    """Print a startup banner (only the name and date line are formatted per call)."""
+    print(
+        f"\n{_BANNER_RULE}\n"
+        f"  🤖  {name} — AI Voice Assistant\n"
+        f"  ⚡  Powered by free & open-source libraries\n"
+        f"  📅  {_banner_date()}\n"
+        f"{_BANNER_TAIL}"
+    )
 
 
 HELP_TEXT = """
@@ -51,8 +64,31 @@ HELP_TEXT = """
 """
 
 
+# Encoded once for the console's codec — print_help() is then a single write
+_HELP_BYTES = (HELP_TEXT + "\n").encode(getattr(sys.stdout, "encoding", None) or "utf-8", "replace")
+
+
 def print_help():
-    print(HELP_TEXT)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:          # e.g. IDLE / redirected to a text-only stream
+        print(HELP_TEXT)
+        return
+    sys.stdout.flush()          # keep ordering with anything already print()ed
+    buffer.write(_HELP_BYTES)
+    buffer.flush()
+
+
+# ── Speech sanitiser patterns (compiled once at import) ──────
+# One alternation handles URLs | markdown bold/italic | header & bullet
+# markers in a single pass; group 2 is the emphasised text to keep.
+_URL_RE   = re.compile(r"https?://\S+")
+_CLEAN_RE = re.compile(r"(https?://\S+)|\*{1,3}(.*?)\*{1,3}|^(?:#{1,6}|[•\-\*])\s+", re.MULTILINE)
+_WS_RE    = re.compile(r"\s+")
+
+
+def _clean_sub(m: re.Match) -> str:
+    # An emphasis span is consumed whole, so drop any URL it wraps here
+    return _URL_RE.sub("", m.group(2) or "")
 
 
 def sanitize_for_speech(text: str) -> str:
@@ -60,17 +96,9 @@ def sanitize_for_speech(text: str) -> str:
     Clean text before passing to TTS — remove markdown, URLs, etc.
     so the speech sounds natural.
     """
-    # Strip URLs
-    text = re.sub(r"https?://\S+", "", text)
-    # Strip markdown bold/italic
-    text = re.sub(r"\*{1,3}(.*?)\*{1,3}", r"\1", text)
-    # Strip markdown headers
-    text = re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)
+    text = _CLEAN_RE.sub(_clean_sub, text)
     # Collapse whitespace
-    text = re.sub(r"\s+", " ", text).strip()
-    # Remove bullet characters
-    text = re.sub(r"^[•\-\*]\s+", "", text, flags=re.MULTILINE)
-    return text
+    return _WS_RE.sub(" ", text).strip()
 
 
 def timestamp_now() -> str:
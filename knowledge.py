@@ -4,33 +4,34 @@
 # ============================================================
 
 import re
-import sys
-import os
+import importlib
+import importlib.util
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 import config
 
 # ── Optional imports with graceful fallbacks ─────────────────
-try:
-    import wikipedia
-    WIKIPEDIA_OK = True
-except ImportError:
-    WIKIPEDIA_OK = False
+# Availability is checked up-front with find_spec (no import cost);
+# the modules themselves are imported on first use via _lazy().
+WIKIPEDIA_OK = importlib.util.find_spec("wikipedia") is not None
+if not WIKIPEDIA_OK:
     print("[WARN] 'wikipedia' not installed. Run: pip install wikipedia-api")
 
-try:
-    from duckduckgo_search import DDGS
-    DDG_OK = True
-except ImportError:
-    DDG_OK = False
+DDG_OK = importlib.util.find_spec("duckduckgo_search") is not None
+if not DDG_OK:
     print("[WARN] 'duckduckgo_search' not installed. Run: pip install duckduckgo-search")
 
-try:
-    import requests
-    from bs4 import BeautifulSoup
-    BS4_OK = True
-except ImportError:
-    BS4_OK = False
+BS4_OK = (importlib.util.find_spec("requests") is not None
+          and importlib.util.find_spec("bs4") is not None)
+
+_modules = {}
+
+
+def _lazy(name: str):
+    """Import `name` on first call and cache it for the rest of the run."""
+    module = _modules.get(name)
+    if module is None:
+        module = _modules[name] = importlib.import_module(name)
+    return module
 
 
 def _trim(text: str, max_sentences: int = config.ANSWER_MAX_SENTENCES) -> str:
@@ -49,6 +50,7 @@ def search_wikipedia(query: str) -> str | None:
     if not WIKIPEDIA_OK:
         return None
     try:
+        wikipedia = _lazy("wikipedia")
         wikipedia.set_lang("en")
         # search() returns page title candidates
         results = wikipedia.search(query, results=3)
@@ -97,6 +99,7 @@ def search_duckduckgo(query: str) -> str | None:
 def _ddg_library(query: str) -> str | None:
     """Use the `duckduckgo_search` library for clean JSON results."""
     try:
+        DDGS = _lazy("duckduckgo_search").DDGS
         with DDGS() as ddgs:
             results = list(ddgs.text(
                 query,
@@ -123,6 +126,8 @@ def _ddg_scrape(query: str) -> str | None:
     Used only if duckduckgo_search is not installed.
     """
     try:
+        requests      = _lazy("requests")
+        BeautifulSoup = _lazy("bs4").BeautifulSoup
         url     = "https://lite.duckduckgo.com/lite/"
         headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
         params  = {"q": query}
@@ -12,25 +12,36 @@ import sys
 import os
 import datetime
 import threading
+from typing import TYPE_CHECKING
 
 # ── Make sure all sub-packages are importable from project root ──
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, PROJECT_ROOT)
 
 import config
-from voice.speech_input    import Listener
-from voice.speech_output   import Speaker
-from brain.processor       import Brain
 from memory.storage        import MemoryStore, ReminderThread
 from windows_control.apps  import AppController
 from utils.helpers         import print_banner, print_help, sanitize_for_speech
 
+if TYPE_CHECKING:   # imported for real inside initialize(), after the banner
+    from voice.speech_output import Speaker
+
+# Phrases answered locally with the help text (hashed O(1) membership)
+_HELP_CMDS = frozenset({"help", "help me", "what can you do", "commands"})
+_WAKE_WORD = config.WAKE_WORD.lower() if config.WAKE_WORD else None
+
 
 # ── Bootstrap ─────────────────────────────────────────────────
 def initialize():
     """Create and wire up all components."""
     print("[BOOT] Initialising NEXIS…")
 
+    # Heavy imports (pyttsx3, SpeechRecognition, wikipedia, DDG…) are
+    # deferred until here so the banner shows up immediately.
+    from voice.speech_input    import Listener
+    from voice.speech_output   import Speaker
+    from brain.processor       import Brain
+
     speaker    = Speaker()
     listener   = Listener()
     memory     = MemoryStore(config.DB_PATH)
@@ -48,7 +59,7 @@ def initialize():
 
 
 # ── Startup greeting ──────────────────────────────────────────
-def greet(speaker: Speaker):
+def greet(speaker: "Speaker"):
     """
     Say the required personalised greeting exactly as specified.
     """
@@ -76,14 +87,20 @@ def run():
 
     while True:
         try:
-            # 1. Get input (voice or keyboard)
+            # 1. Get input (voice or keyboard). Speech is queued, so let
+            #    it finish first — otherwise the mic would hear NEXIS itself.
+            if listener.mic_available:
+                speaker.wait()
             user_input = listener.listen()
 
             if not user_input:
                 continue
 
+            # Normalise once — reused by the help and wake-word checks
+            command = user_input.strip().lower()
+
             # 2. Handle "help" locally so we don't waste a search call
-            if user_input.strip() in ("help", "help me", "what can you do", "commands"):
+            if command in _HELP_CMDS:
                 print_help()
                 speaker.say("I can search Wikipedia and the web, open apps, set reminders, "
                              "remember things, do maths, and control your Windows PC. "
@@ -91,18 +108,19 @@ def run():
                 continue
 
             # 3. Respect wake word (if configured)
-            if config.WAKE_WORD:
-                if config.WAKE_WORD.lower() not in user_input:
+            if _WAKE_WORD:
+                if _WAKE_WORD not in command:
                     continue   # silently ignore — waiting for wake word
                 # Strip the wake word from the query before processing
-                user_input = user_input.replace(config.WAKE_WORD.lower(), "").strip()
+                user_input = command.replace(_WAKE_WORD, "").strip()
 
             # 4. Let the brain process the command
             response, should_exit = brain.process(user_input)
 
-            # 5. Speak the response
-            clean_response = sanitize_for_speech(response)
-            speaker.say(clean_response)
+            # 5. Speak the response. Multi-line replies come back as a list
+            #    (spoken as one batch); web lookups arrive as a Future and are
+            #    awaited on the TTS thread, so the loop moves on right away.
+            speaker.say(response, transform=sanitize_for_speech)
 
             # 6. Exit if the brain says so (bye / exit commands)
             if should_exit:
@@ -118,6 +136,7 @@ def run():
 
     # ── Cleanup ───────────────────────────────────────────────
     reminder_thread.stop()
+    speaker.wait()   # let the goodbye finish before the TTS thread dies
     print("\n[BOOT] NEXIS shut down. Goodbye!\n")
 
 
@@ -6,13 +6,20 @@
 # ============================================================
 
 import re
-import math
+import ast
+import operator
 import random
 import datetime
-import sys
-import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+
+# ── Optional fast intent prefilter ───────────────────────────
+try:
+    import ahocorasick
+    AHOCORASICK_OK = True
+except ImportError:
+    AHOCORASICK_OK = False
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 import config
 from brain import knowledge
 from memory.storage import MemoryStore
@@ -44,7 +51,9 @@ HOW_ARE_YOU_PATTERNS = [
 ]
 
 # ── Intent detectors (compiled for speed) ────────────────────
-_RE = {k: re.compile(p, re.IGNORECASE) for k, p in {
+# Case-sensitive on purpose: process() lowers the text once, and dropping
+# IGNORECASE lets sre take its literal fast paths instead of case-folding.
+_RE = {k: re.compile(p) for k, p in {
     "greeting"     : "|".join(GREETING_PATTERNS),
     "farewell"     : "|".join(FAREWELL_PATTERNS),
     "how_are_you"  : "|".join(HOW_ARE_YOU_PATTERNS),
@@ -53,7 +62,8 @@ _RE = {k: re.compile(p, re.IGNORECASE) for k, p in {
     "day"          : r"\b(what day|which day)\b",
     "open_app"     : r"\b(open|launch|start|run)\b",
     "close_app"    : r"\b(close|kill|stop|quit|exit)\b",
-    "open_folder"  : r"\b(open|show|go to)\b.*(folder|directory|downloads|documents|desktop|pictures|music|videos)\b",
+    "folder_verb"  : r"\b(open|show|go to)\b",
+    "folder_target": r"(folder|directory|downloads|documents|desktop|pictures|music|videos)\b",
     "remind"       : r"\bremind\s+me\b",
     "remember"     : r"\bremember\s+(that\s+)?(.*)",
     "recall"       : r"\b(what do you remember|recall|show memories|my notes)\b",
@@ -70,11 +80,215 @@ _RE = {k: re.compile(p, re.IGNORECASE) for k, p in {
     "lock"         : r"\b(lock (the )?screen|lock pc|lock computer)\b",
     "shutdown"     : r"\b(shutdown|shut down|power off|turn off (the )?pc)\b",
     "restart"      : r"\b(restart|reboot)\b",
-    "sleep_pc"     : r"\b(sleep|hibernate|put to sleep)\b.*(pc|computer|system)?\b",
+    "sleep_pc"     : r"\b(sleep|hibernate|put to sleep)\b",
     "list_reminders": r"\b(list reminders|show reminders|my reminders|pending reminders)\b",
     "clear_memory" : r"\b(clear memory|forget everything|delete memories)\b",
+    # ── Extraction / cleanup patterns used by the handlers ──
+    "strip_what_is": r"\b(what is|what are|who is|who was|tell me about|explain|define|describe)\b",
+    "strip_search" : r"\b(search for|look up|find|google|search)\b",
+    "strip_calc"   : r"\b(calculate|what is|compute|how much is)\b",
+    "remind_time"  : r"at\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm)?",
+    "remind_task"  : r"remind\s+me\s+to\s+(.+?)(?:\s+at\s+[\d:]+|\s*$)",
+    "remember_fact": r"remember\s+(?:that\s+)?(.+)",
 }.items()}
 
+# Bound .search methods — skips the attribute lookup on every intent check
+_SEARCH = {k: v.search for k, v in _RE.items()}
+
+
+def _search_open_folder(t: str):
+    """
+    "open|show|go to" followed later by a folder word. Two linear scans
+    replace `verb\b.*target\b`, whose `.*` backtracked once per verb
+    occurrence (quadratic on long typed input). The first verb suffices:
+    any target after a later verb is also after the first one.
+    """
+    verb = _RE["folder_verb"].search(t)
+    return verb and _RE["folder_target"].search(t, verb.end())
+
+
+_SEARCH["open_folder"] = _search_open_folder
+
+# ── Spoken date/time formats ──────────────────────────────────
+TIME_FMT = "%I:%M %p"
+DATE_FMT = "%A, %B %d, %Y"
+DAY_FMT  = "%A"
+
+# ── Intent keywords (one Aho-Corasick pass instead of ~25 scans) ─
+# Every match of _SEARCH[intent] contains at least one of these literals, so an
+# intent whose keywords are absent from the text can skip its regex entirely.
+# The regexes still confirm word boundaries (e.g. "hi" inside "this").
+# Keep in sync with _RE above; _check_intent_keywords() verifies at import that
+# every intent in Brain's dispatch table has an entry here, and nothing else does.
+_INTENT_KEYWORDS = {
+    "greeting"      : ("hi", "hello", "hey", "yo", "what's up", "sup", "howdy", "hiya",
+                       "good morning", "good afternoon", "good evening", "good night"),
+    "farewell"      : ("bye", "goodbye", "exit", "quit", "see you", "later", "cya", "peace out", "shut down"),
+    "how_are_you"   : ("how are you", "how're you", "how do you feel", "are you okay", "you good"),
+    "time"          : ("what time", "current time", "what's the time", "tell me the time"),
+    "date"          : ("what's today", "what is today", "what's the date", "what is the date",
+                       "today's date", "current date"),
+    "day"           : ("what day", "which day"),
+    "open_app"      : ("open", "launch", "start", "run"),
+    "close_app"     : ("close", "kill", "stop", "quit", "exit"),
+    "open_folder"   : ("open", "show", "go to"),
+    "remind"        : ("remind",),
+    "remember"      : ("remember",),
+    "recall"        : ("what do you remember", "recall", "show memories", "my notes"),
+    "joke"          : ("joke", "make me laugh", "something funny"),
+    "what_is"       : ("what is", "what are", "who is", "who was", "tell me about", "explain", "define", "describe"),
+    "search"        : ("search", "look up", "find", "google"),
+    "weather"       : ("weather", "temperature", "forecast", "rain", "sunny"),
+    "news"          : ("news", "latest", "headlines"),
+    "volume_up"     : ("volume up", "louder", "increase volume"),
+    "volume_down"   : ("volume down", "quieter", "lower volume", "decrease volume"),
+    "mute"          : ("mute", "silence"),
+    "screenshot"    : ("screenshot", "screen capture", "capture screen"),
+    "lock"          : ("lock",),
+    "shutdown"      : ("shutdown", "shut down", "power off", "turn off"),
+    "restart"       : ("restart", "reboot"),
+    "sleep_pc"      : ("sleep", "hibernate"),
+    "list_reminders": ("list reminders", "show reminders", "my reminders", "pending reminders"),
+    "clear_memory"  : ("clear memory", "forget everything", "delete memories"),
+}
+
+def _keyword_intents() -> dict[str, tuple]:
+    """keyword → tuple of intents it can trigger."""
+    kw_intents = {}
+    for intent, keywords in _INTENT_KEYWORDS.items():
+        for kw in keywords:
+            kw_intents.setdefault(kw, []).append(intent)
+    return {kw: tuple(intents) for kw, intents in kw_intents.items()}
+
+
+def _build_intent_automaton():
+    """Compile every keyword into one Aho-Corasick automaton."""
+    automaton = ahocorasick.Automaton()
+    for kw, intents in _keyword_intents().items():
+        automaton.add_word(kw, intents)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_keyword_buckets():
+    """
+    Fallback scanner when pyahocorasick is missing: keywords are bucketed by
+    leading character into one `c(?=(rest|…))` regex each. The literal first
+    character keeps sre on its memchr prefix fast path, and the zero-width
+    lookahead lets finditer find overlapping keywords.
+    """
+    kw_intents = _keyword_intents()
+    # At any position only the longest keyword is reported, so a hit also
+    # implies every keyword that is a prefix of it ("search for" → "search").
+    implied = {
+        kw: tuple({i for other, intents in kw_intents.items() if kw.startswith(other) for i in intents})
+        for kw in kw_intents
+    }
+    buckets = {}
+    for kw in kw_intents:
+        buckets.setdefault(kw[0], []).append(kw)
+    compiled = []
+    for first, keywords in buckets.items():
+        keywords.sort(key=len, reverse=True)
+        rest = "|".join(re.escape(kw[1:]) for kw in keywords)
+        compiled.append((first, re.compile(f"{re.escape(first)}(?=({rest}))")))
+    return compiled, implied
+
+
+if AHOCORASICK_OK:
+    _INTENT_AC = _build_intent_automaton()
+else:
+    _INTENT_AC = None
+    _KW_BUCKETS, _KW_IMPLIED = _build_keyword_buckets()
+
+
+def _candidate_intents(t: str) -> set:
+    """Intents whose keywords occur in `t` (one linear keyword scan)."""
+    hits = set()
+    if _INTENT_AC is not None:
+        for _, intents in _INTENT_AC.iter(t):
+            hits.update(intents)
+        return hits
+    for first, bucket in _KW_BUCKETS:
+        for m in bucket.finditer(t):
+            hits.update(_KW_IMPLIED[first + m.group(1)])
+    return hits
+
+
+# ── Calculator: whitelisted AST evaluator (no eval) ──────────
+# Characters a spoken maths expression may contain (checked with a set, not a regex)
+_MATH_CHARS = frozenset("0123456789 \t\n\r\f\v+-*/^().")
+
+_MATH_BINOPS = {
+    ast.Add      : operator.add,
+    ast.Sub      : operator.sub,
+    ast.Mult     : operator.mul,
+    ast.Div      : operator.truediv,
+    ast.FloorDiv : operator.floordiv,
+    ast.Pow      : operator.pow,
+}
+_MATH_UNARYOPS = {
+    ast.UAdd : operator.pos,
+    ast.USub : operator.neg,
+}
+
+
+def _eval_node(node):
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _MATH_BINOPS:
+        return _MATH_BINOPS[type(node.op)](_eval_node(node.left), _eval_node(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _MATH_UNARYOPS:
+        return _MATH_UNARYOPS[type(node.op)](_eval_node(node.operand))
+    raise ValueError(f"unsupported expression: {ast.dump(node)}")
+
+
+@lru_cache(maxsize=256)
+def _eval_math(expr: str):
+    """Parse + evaluate an arithmetic expression; repeats are served from cache."""
+    return _eval_node(ast.parse(expr.strip(), mode="eval").body)
+
+
+@lru_cache(maxsize=32)
+def _weekday(iso_date: str) -> str:
+    """'2025-01-31' → 'Friday' (reminders cluster on a few dates, so this caches well)."""
+    return datetime.date.fromisoformat(iso_date).strftime(DAY_FMT)
+
+
+def _spoken_reminder_time(remind_at: str) -> str:
+    """
+    Format our own 'YYYY-MM-DDTHH:MM:SS' string like strftime('%A %I:%M %p')
+    by slicing it, instead of parsing a datetime per row.
+    """
+    hour = int(remind_at[11:13])
+    return f"{_weekday(remind_at[:10])} {hour % 12 or 12:02d}:{remind_at[14:16]} {'AM' if hour < 12 else 'PM'}"
+
+
+def _reply(result: str | None):
+    """Wrap an optional handler result: (result, False), or None to fall through."""
+    return (result, False) if result else None
+
+
+def _longest_name_matcher(names):
+    """
+    Build `match(text) → name | None` returning the longest of `names` that
+    occurs in `text` (ties resolved in config order, like the old sorted scan).
+    """
+    ordered = sorted(names, key=len, reverse=True)
+    if not AHOCORASICK_OK:
+        return lambda text: next((name for name in ordered if name in text), None)
+
+    automaton = ahocorasick.Automaton()
+    for rank, name in enumerate(ordered):
+        automaton.add_word(name, (-rank, name))
+    automaton.make_automaton()
+
+    def match(text: str) -> str | None:
+        best = max((value for _, value in automaton.iter(text)), default=None)
+        return best[1] if best else None
+
+    return match
+
 
 class Brain:
     """
@@ -84,126 +298,103 @@ class Brain:
     def __init__(self, memory: MemoryStore, app_ctrl: AppController):
         self.memory   = memory
         self.app_ctrl = app_ctrl
+        # Name lookups are compiled once instead of re-sorting per command
+        self._match_app     = _longest_name_matcher(config.APP_COMMANDS)
+        self._match_process = _longest_name_matcher(config.PROCESS_NAMES)
+        self._match_folder  = _longest_name_matcher(config.FOLDER_COMMANDS)
+        self._dispatch      = self._build_dispatch()
+        # Web lookups run here so the main loop isn't held up by the network
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="lookup")
+
+    def _build_dispatch(self) -> tuple:
+        """
+        (intent, bound regex search, handler) in priority order — first match
+        wins. handler(t, m, now) returns (response, should_exit) or None to
+        fall through. intent=None means "always try" (the calculator).
+        """
+        ctrl = self.app_ctrl
+        table = (
+            ("farewell",       lambda t, m, now: (f"Take care, {config.USER_NAME}! Shutting down now.", True)),
+            ("greeting",       lambda t, m, now: (self._greet(now), False)),
+            ("how_are_you",    lambda t, m, now: ("I'm running perfectly — ready to help you, " + config.USER_NAME + "!", False)),
+            # ─ Time / Date
+            ("time",           lambda t, m, now: ("It's currently " + now.strftime(TIME_FMT) + ".", False)),
+            ("date",           lambda t, m, now: ("Today is " + now.strftime(DATE_FMT) + ".", False)),
+            ("day",            lambda t, m, now: ("Today is " + now.strftime(DAY_FMT) + ".", False)),
+            ("joke",           lambda t, m, now: (random.choice(JOKES), False)),
+            # ─ System control
+            ("lock",           lambda t, m, now: (ctrl.lock_screen(), False)),
+            ("shutdown",       lambda t, m, now: (ctrl.shutdown_pc(), False)),
+            ("restart",        lambda t, m, now: (ctrl.restart_pc(), False)),
+            ("sleep_pc",       lambda t, m, now: (ctrl.sleep_pc(), False)),
+            ("screenshot",     lambda t, m, now: (ctrl.take_screenshot(), False)),
+            ("volume_up",      lambda t, m, now: (ctrl.volume_change("up"), False)),
+            ("volume_down",    lambda t, m, now: (ctrl.volume_change("down"), False)),
+            ("mute",           lambda t, m, now: (ctrl.volume_change("mute"), False)),
+            # ─ Apps & folders (fall through when no known name is mentioned)
+            ("open_folder",    lambda t, m, now: _reply(self._handle_folder(t))),
+            ("open_app",       lambda t, m, now: _reply(self._handle_open(t))),
+            ("close_app",      lambda t, m, now: _reply(self._handle_close(t))),
+            # ─ Reminders & memory
+            ("remind",         lambda t, m, now: (self._handle_remind(t, now), False)),
+            ("list_reminders", lambda t, m, now: (self._list_reminders(), False)),
+            ("remember",       lambda t, m, now: (self._handle_remember(t, m), False)),
+            ("recall",         lambda t, m, now: (self._handle_recall(), False)),
+            ("clear_memory",   lambda t, m, now: (self._handle_clear_memory(), False)),
+            # ─ Calculator
+            (None,             lambda t, m, now: _reply(self._try_calculate(t))),
+            # ─ Weather notice (no weather API — honest response)
+            ("weather",        lambda t, m, now: ("I don't have a weather API, but you can check weather.com or ask "
+                                                  "me to open Chrome and search for the weather.", False)),
+            # ─ Knowledge lookups
+            ("what_is",        lambda t, m, now: (self._lookup(_RE["strip_what_is"].sub("", t).strip(),
+                                                                prefer_wikipedia=True), False)),
+            ("search",         lambda t, m, now: (self._lookup(_RE["strip_search"].sub("", t).strip(),
+                                                                prefer_wikipedia=False), False)),
+            ("news",           lambda t, m, now: (self._lookup("latest news today", prefer_wikipedia=False), False)),
+        )
+        return tuple((intent, _SEARCH.get(intent), handler) for intent, handler in table)
 
     # ── Entry point ───────────────────────────────────────────
-    def process(self, text: str) -> tuple[str, bool]:
+    def process(self, text: str) -> tuple[str | list[str] | Future, bool]:
         """
-        Process `text` and return (response_string, should_exit).
+        Process `text` and return (response, should_exit).
+        response is a string, a list of lines to speak in one go, or a
+        Future[str] for web lookups that are still in flight.
         should_exit=True signals the main loop to stop.
         """
         t = text.strip().lower()
         if not t:
             return "I didn't catch that. Could you repeat?", False
 
-        # ─ Farewell ──────────────────────────────────────────
-        if _RE["farewell"].search(t):
-            return f"Take care, {config.USER_NAME}! Shutting down now.", True
-
-        # ─ Greeting ──────────────────────────────────────────
-        if _RE["greeting"].search(t):
-            return self._greet(), False
-
-        # ─ How are you ───────────────────────────────────────
-        if _RE["how_are_you"].search(t):
-            return "I'm running perfectly — ready to help you, " + config.USER_NAME + "!", False
-
-        # ─ Time / Date ───────────────────────────────────────
-        if _RE["time"].search(t):
-            return "It's currently " + datetime.datetime.now().strftime("%I:%M %p") + ".", False
-        if _RE["date"].search(t):
-            return "Today is " + datetime.datetime.now().strftime("%A, %B %d, %Y") + ".", False
-        if _RE["day"].search(t):
-            return "Today is " + datetime.datetime.now().strftime("%A") + ".", False
-
-        # ─ Jokes ─────────────────────────────────────────────
-        if _RE["joke"].search(t):
-            return random.choice(JOKES), False
-
-        # ─ System control ────────────────────────────────────
-        if _RE["lock"].search(t):
-            return self.app_ctrl.lock_screen(), False
-        if _RE["shutdown"].search(t):
-            return self.app_ctrl.shutdown_pc(), False
-        if _RE["restart"].search(t):
-            return self.app_ctrl.restart_pc(), False
-        if _RE["sleep_pc"].search(t):
-            return self.app_ctrl.sleep_pc(), False
-        if _RE["screenshot"].search(t):
-            return self.app_ctrl.take_screenshot(), False
-        if _RE["volume_up"].search(t):
-            return self.app_ctrl.volume_change("up"), False
-        if _RE["volume_down"].search(t):
-            return self.app_ctrl.volume_change("down"), False
-        if _RE["mute"].search(t):
-            return self.app_ctrl.volume_change("mute"), False
-
-        # ─ Open folder ───────────────────────────────────────
-        if _RE["open_folder"].search(t):
-            result = self._handle_folder(t)
-            if result:
-                return result, False
-
-        # ─ Open app ──────────────────────────────────────────
-        if _RE["open_app"].search(t):
-            result = self._handle_open(t)
-            if result:
-                return result, False
-
-        # ─ Close app ─────────────────────────────────────────
-        if _RE["close_app"].search(t):
-            result = self._handle_close(t)
-            if result:
-                return result, False
-
-        # ─ Reminders ─────────────────────────────────────────
-        if _RE["remind"].search(t):
-            return self._handle_remind(t), False
-
-        if _RE["list_reminders"].search(t):
-            return self._list_reminders(), False
-
-        # ─ Memory ────────────────────────────────────────────
-        m = _RE["remember"].search(t)
-        if m:
-            return self._handle_remember(t, m), False
-
-        if _RE["recall"].search(t):
-            return self._handle_recall(), False
-
-        if _RE["clear_memory"].search(t):
-            self.memory.clear_memories()
-            return "I've cleared all stored memories.", False
-
-        # ─ Calculator ────────────────────────────────────────
-        calc_result = self._try_calculate(t)
-        if calc_result is not None:
-            return calc_result, False
-
-        # ─ Weather notice (no weather API — honest response) ──
-        if _RE["weather"].search(t):
-            return ("I don't have a weather API, but you can check weather.com or ask me to open Chrome "
-                    "and search for the weather."), False
-
-        # ─ Wikipedia "what is / who is" queries ──────────────
-        if _RE["what_is"].search(t):
-            cleaned = re.sub(r"\b(what is|what are|who is|who was|tell me about|explain|define|describe)\b", "", t, flags=re.IGNORECASE).strip()
-            return knowledge.find_answer(cleaned, prefer_wikipedia=True), False
-
-        # ─ Explicit search ────────────────────────────────────
-        if _RE["search"].search(t):
-            cleaned = re.sub(r"\b(search for|look up|find|google|search)\b", "", t, flags=re.IGNORECASE).strip()
-            return knowledge.find_answer(cleaned, prefer_wikipedia=False), False
-
-        # ─ News ───────────────────────────────────────────────
-        if _RE["news"].search(t):
-            return knowledge.find_answer("latest news today", prefer_wikipedia=False), False
+        # One keyword scan decides which intent regexes are worth running
+        hits = _candidate_intents(t)
+        now  = datetime.datetime.now()   # single clock read per utterance
+
+        # Walk the intent table in priority order; a handler may return None
+        # to fall through to the next intent (e.g. "open" with no known app).
+        for intent, search, handler in self._dispatch:
+            m = None
+            if intent is not None:
+                if intent not in hits:
+                    continue
+                m = search(t)
+                if not m:
+                    continue
+            reply = handler(t, m, now)
+            if reply:
+                return reply
 
         # ─ Catch-all: treat anything else as a search query ───
-        return knowledge.find_answer(t, prefer_wikipedia=True), False
+        return self._lookup(t, prefer_wikipedia=True), False
+
+    def _lookup(self, query: str, prefer_wikipedia: bool) -> Future:
+        """Start a knowledge lookup in the background and return its Future."""
+        return self._pool.submit(knowledge.find_answer, query, prefer_wikipedia=prefer_wikipedia)
 
     # ── Intent handlers ──────────────────────────────────────
-    def _greet(self) -> str:
-        hour = datetime.datetime.now().hour
+    def _greet(self, now: datetime.datetime | None = None) -> str:
+        hour = (now or datetime.datetime.now()).hour
         if 5 <= hour < 12:
             tod = "Good morning"
         elif 12 <= hour < 17:
@@ -215,38 +406,26 @@ class Brain:
         return f"{tod}, {config.USER_NAME}! How can I help you today?"
 
     def _handle_open(self, text: str) -> str | None:
-        for app_name in sorted(config.APP_COMMANDS, key=len, reverse=True):
-            if app_name in text:
-                return self.app_ctrl.open_app(app_name)
-        return None
+        app_name = self._match_app(text)
+        return self.app_ctrl.open_app(app_name) if app_name else None
 
     def _handle_close(self, text: str) -> str | None:
-        for app_name in sorted(config.PROCESS_NAMES, key=len, reverse=True):
-            if app_name in text:
-                return self.app_ctrl.close_app(app_name)
-        return None
+        app_name = self._match_process(text)
+        return self.app_ctrl.close_app(app_name) if app_name else None
 
     def _handle_folder(self, text: str) -> str | None:
-        for folder_name in sorted(config.FOLDER_COMMANDS, key=len, reverse=True):
-            if folder_name in text:
-                return self.app_ctrl.open_folder(folder_name)
-        return None
+        folder_name = self._match_folder(text)
+        return self.app_ctrl.open_folder(folder_name) if folder_name else None
 
-    def _handle_remind(self, text: str) -> str:
+    def _handle_remind(self, text: str, now: datetime.datetime | None = None) -> str:
         """
         Parse phrases like:
           "remind me to call mom at 8 pm"
           "remind me to take medicine at 14:30"
         """
         # Try to extract time patterns
-        time_pattern = re.search(
-            r"at\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm)?",
-            text, re.IGNORECASE
-        )
-        task_match = re.search(
-            r"remind\s+me\s+to\s+(.+?)(?:\s+at\s+[\d:]+|\s*$)",
-            text, re.IGNORECASE
-        )
+        time_pattern = _SEARCH["remind_time"](text)
+        task_match   = _SEARCH["remind_task"](text)
 
         if not task_match:
             return "What should I remind you about, and at what time?"
@@ -261,60 +440,75 @@ class Brain:
                 hour += 12
             elif meridiem and meridiem.lower() == "am" and hour == 12:
                 hour = 0
-            now = datetime.datetime.now()
+            now = now or datetime.datetime.now()
             remind_dt = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
             if remind_dt <= now:
                 remind_dt += datetime.timedelta(days=1)  # schedule for tomorrow
 
             self.memory.add_reminder(task, remind_dt)
-            time_str = remind_dt.strftime("%I:%M %p")
+            time_str = remind_dt.strftime(TIME_FMT)
             return f"Got it! I'll remind you to '{task}' at {time_str}."
         else:
             return f"When should I remind you to '{task}'? Please say a time like 'at 8 pm'."
 
-    def _list_reminders(self) -> str:
+    def _list_reminders(self) -> str | list[str]:
         reminders = self.memory.get_pending_reminders()
         if not reminders:
             return "You have no pending reminders."
-        lines = []
-        for r in reminders:
-            dt = datetime.datetime.fromisoformat(r["remind_at"])
-            lines.append(f"• {r['task']} — {dt.strftime('%A %I:%M %p')}")
-        return "Your reminders:\n" + "\n".join(lines)
+        lines = [f"• {r['task']} — {_spoken_reminder_time(r['remind_at'])}" for r in reminders]
+        return ["Your reminders:", *lines]
 
     def _handle_remember(self, text: str, match) -> str:
         # Extract everything after "remember that" or "remember"
-        fact_match = re.search(
-            r"remember\s+(?:that\s+)?(.+)", text, re.IGNORECASE
-        )
+        fact_match = _SEARCH["remember_fact"](text)
         if fact_match:
             fact = fact_match.group(1).strip()
             self.memory.save_memory(fact)
             return f"I'll remember that: '{fact}'"
         return "What would you like me to remember?"
 
-    def _handle_recall(self) -> str:
+    def _handle_clear_memory(self) -> str:
+        self.memory.clear_memories()
+        return "I've cleared all stored memories."
+
+    def _handle_recall(self) -> str | list[str]:
         memories = self.memory.get_all_memories()
         if not memories:
             return "I don't have anything saved in memory yet."
         lines = [f"• {m['content']}  (saved {m['saved_at'][:10]})" for m in memories]
-        return "Here's what I remember:\n" + "\n".join(lines)
+        return ["Here's what I remember:", *lines]
 
     def _try_calculate(self, text: str) -> str | None:
         """Safely evaluate simple arithmetic expressions."""
         # Strip known prefixes
-        cleaned = re.sub(
-            r"\b(calculate|what is|compute|how much is)\b", "", text, flags=re.IGNORECASE
-        ).strip()
+        cleaned = _RE["strip_calc"].sub("", text).strip()
 
         # Must look like a math expression
-        if not re.match(r"^[\d\s\+\-\*\/\^\(\)\.]+$", cleaned):
+        if not cleaned or not _MATH_CHARS.issuperset(cleaned):
             return None
 
         try:
             # Replace ^ with ** for Python exponentiation
             expr   = cleaned.replace("^", "**")
-            result = eval(expr, {"__builtins__": {}, "math": math})  # sandboxed eval
+            result = _eval_math(expr)
             return f"The answer is {result}."
         except Exception:
             return None
+
+
+def _check_intent_keywords():
+    """
+    Fail at import if _INTENT_KEYWORDS and the dispatch table drift apart:
+    an intent without keywords would never be a candidate, silently.
+    """
+    probe = Brain.__new__(Brain)   # _build_dispatch only reads app_ctrl eagerly
+    probe.app_ctrl = None
+    intents = {intent for intent, _, _ in probe._build_dispatch() if intent is not None}
+    missing = intents - _INTENT_KEYWORDS.keys()
+    unknown = _INTENT_KEYWORDS.keys() - intents
+    if missing or unknown:
+        raise RuntimeError(f"_INTENT_KEYWORDS out of sync with Brain._build_dispatch: "
+                           f"missing {sorted(missing)}, unknown {sorted(unknown)}")
+
+
+_check_intent_keywords()
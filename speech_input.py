@@ -6,10 +6,8 @@
 # ============================================================
 
 import speech_recognition as sr
-import sys
-import os
+import atexit
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 import config
 
 
@@ -26,18 +24,28 @@ class Listener:
         self.recognizer.dynamic_energy_threshold = True   # auto-adjusts to ambient noise
         self.recognizer.pause_threshold          = 0.8    # seconds of silence = end of phrase
 
-        # Test mic availability once at startup
-        self.mic_available = self._check_mic()
+        # Open the mic once at startup and keep the stream alive between turns
+        self._mic    = None
+        self._source = None
+        self.mic_available = self._open_mic()
 
-    def _check_mic(self) -> bool:
+    def _open_mic(self) -> bool:
         try:
-            with sr.Microphone() as _:
-                pass
-            print("[MIC] Microphone detected ✓")
-            return True
+            self._mic    = sr.Microphone()
+            self._source = self._mic.__enter__()
         except (OSError, AttributeError):
             print("[MIC] No microphone found — keyboard mode activated.")
             return False
+        atexit.register(self._close_mic)
+        print("[MIC] Microphone detected ✓")
+        # Calibrate once; dynamic_energy_threshold keeps adapting while listening
+        self.recognizer.adjust_for_ambient_noise(self._source, duration=0.5)
+        return True
+
+    def _close_mic(self):
+        if self._source is not None:
+            self._mic.__exit__(None, None, None)
+            self._source = None
 
     def _transcribe(self, audio) -> str | None:
         """Send audio to the configured recognition engine."""
@@ -69,14 +77,11 @@ class Listener:
 
         print("🎤 Listening…")
         try:
-            with sr.Microphone() as source:
-                # Brief ambient-noise calibration on each call keeps accuracy high
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                audio = self.recognizer.listen(
-                    source,
-                    timeout           = config.SR_TIMEOUT,
-                    phrase_time_limit = config.SR_PHRASE_TIME_LIMIT,
-                )
+            audio = self.recognizer.listen(
+                self._source,
+                timeout           = config.SR_TIMEOUT,
+                phrase_time_limit = config.SR_PHRASE_TIME_LIMIT,
+            )
             text = self._transcribe(audio)
             if text:
                 text = text.strip().lower()
@@ -4,24 +4,51 @@
 # ============================================================
 
 import pyttsx3
+import queue
 import threading
-import sys
-import os
+from concurrent.futures import Future
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 import config
 
 
 class Speaker:
     """
     Wraps pyttsx3 for natural-sounding offline TTS.
-    A threading lock ensures only one utterance plays at a time.
+    Speech runs on a dedicated worker thread fed by a queue, so say()
+    returns immediately; utterances still play one at a time, in order.
     """
 
     def __init__(self):
-        self._engine = pyttsx3.init()
-        self._lock   = threading.Lock()
-        self._apply_settings()
+        self._q     = queue.Queue()
+        self._ready = threading.Event()
+        # The engine is created on the worker thread itself: SAPI5 (COM)
+        # objects must be used from the thread that created them.
+        self._init_error = None
+        threading.Thread(target=self._worker, name="tts", daemon=True).start()
+        self._ready.wait()
+        if self._init_error:
+            raise self._init_error
+
+    def _worker(self):
+        try:
+            self._engine = pyttsx3.init()
+            self._apply_settings()
+        except Exception as e:
+            self._init_error = e
+            return
+        finally:
+            self._ready.set()
+        while True:
+            item = self._q.get()
+            try:
+                if callable(item):
+                    item()
+                else:
+                    self._speak_parts(*item)
+            except Exception as e:
+                print(f"[TTS] Error: {e}")
+            finally:
+                self._q.task_done()
 
     def _apply_settings(self):
         """Apply rate, volume, and voice index from config."""
@@ -35,24 +62,66 @@ class Speaker:
         else:
             print("[TTS] Using default system voice.")
 
-    def say(self, text: str, print_text: bool = True):
+    def say(self, text: str | list[str] | Future, print_text: bool = True, transform=None):
         """
-        Speak `text` aloud.
+        Queue `text` to be spoken aloud and return immediately.
         - print_text=True  → also echoes to the console.
-        - Thread-safe via internal lock.
+        - transform        → optional str → str applied before speaking.
+        - `text` may be a list of parts (see say_many) or a Future[str];
+          a Future is awaited on the TTS thread, in queue order, so a slow
+          lookup never blocks the caller.
+        - Thread-safe; utterances play in the order they were queued.
+        """
+        if isinstance(text, Future):
+            self._q.put(lambda: self._speak_future(text, print_text, transform))
+        else:
+            self.say_many(text if isinstance(text, list) else [text], print_text, transform)
+
+    def say_many(self, parts: list[str], print_text: bool = True, transform=None):
+        """
+        Queue several utterances as one batch: the driver gets every part
+        before a single runAndWait(), instead of one event-loop spin each.
+        """
+        if transform:
+            parts = [transform(p) for p in parts]
+        parts = [p for p in parts if p and p.strip()]
+        if parts:
+            self._q.put((parts, print_text))
+
+    def _speak_parts(self, parts: list[str], print_text: bool):
+        """
+        Runs on the TTS thread: echo, hand every part to the driver, then
+        play. Echoing here keeps the console in step with what is heard.
         """
-        if not text or not text.strip():
-            return
         if print_text:
-            print(f"\n🤖 {config.ASSISTANT_NAME}: {text}\n")
-        with self._lock:
-            self._engine.say(text)
-            self._engine.runAndWait()
+            print(f"\n🤖 {config.ASSISTANT_NAME}: " + "\n".join(parts) + "\n")
+        for part in parts:
+            self._engine.say(part)
+        self._engine.runAndWait()
+
+    def _speak_future(self, future: Future, print_text: bool, transform):
+        """Runs on the TTS thread: wait for `future`, then speak its result."""
+        try:
+            text = future.result()
+        except Exception as e:
+            print(f"[TTS] Lookup failed: {e}")
+            text = "Something went wrong. Please try again."
+        if transform:
+            text = transform(text)
+        if text and text.strip():
+            self._speak_parts([text], print_text)
+
+    def wait(self):
+        """Block until everything queued so far has been spoken."""
+        self._q.join()
 
     def list_voices(self):
         """Utility: print every TTS voice installed on this machine."""
-        voices = self._engine.getProperty("voices")
-        print("\n=== Available TTS Voices ===")
-        for i, v in enumerate(voices):
-            print(f"  [{i}] {v.name}  —  {v.id}")
-        print(f"\nChange TTS_VOICE_INDEX in config.py to switch voices.\n")
\ No newline at end of file
+        def _print_voices():
+            voices = self._engine.getProperty("voices")
+            print("\n=== Available TTS Voices ===")
+            for i, v in enumerate(voices):
+                print(f"  [{i}] {v.name}  —  {v.id}")
+            print(f"\nChange TTS_VOICE_INDEX in config.py to switch voices.\n")
+        self._q.put(_print_voices)
+        self.wait()
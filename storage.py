@@ -6,12 +6,23 @@
 import sqlite3
 import datetime
 import threading
+import heapq
+import time
 import os
-import sys
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 import config
 
+# ── SQL statements ────────────────────────────────────────────
+# The connection's statement cache (keyed by SQL text) is what saves the
+# re-parse; it only pays off because the connection below is long-lived.
+_SQL_SAVE_MEMORY       = "INSERT INTO memories (content, saved_at) VALUES (?, ?)"
+_SQL_ALL_MEMORIES      = "SELECT content, saved_at FROM memories ORDER BY id DESC"
+_SQL_CLEAR_MEMORIES    = "DELETE FROM memories"
+_SQL_ADD_REMINDER      = "INSERT INTO reminders (task, remind_at) VALUES (?, ?)"
+_SQL_PENDING_REMINDERS = "SELECT id, task, remind_at FROM reminders WHERE notified=0 ORDER BY remind_at"
+_SQL_DUE_REMINDERS     = "SELECT id, task, remind_at FROM reminders WHERE notified=0 AND remind_at <= ?"
+_SQL_MARK_NOTIFIED     = "UPDATE reminders SET notified=1 WHERE id=?"
+
 
 class MemoryStore:
     """
@@ -25,19 +36,31 @@ class MemoryStore:
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         self.db_path = db_path
         self._lock   = threading.Lock()
+        # Bumped + notified whenever a reminder is added, so ReminderThread
+        # can re-plan its sleep instead of polling.
+        self.reminders_changed = threading.Condition()
+        self.reminder_version  = 0
+        # One long-lived connection shared by all threads (guarded by _lock);
+        # autocommit mode, so every statement commits on its own.
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row   # enables dict-style row access
+        self._conn.execute("PRAGMA journal_mode=WAL")      # readers don't block the writer
+        self._conn.execute("PRAGMA synchronous=NORMAL")    # safe with WAL, far fewer fsyncs
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-2000")      # keep ~2 MB of pages resident
         self._init_db()
 
     # ── DB setup ──────────────────────────────────────────────
     def _init_db(self):
-        with self._connect() as conn:
-            conn.execute("""
+        with self._lock:
+            self._conn.execute("""
                 CREATE TABLE IF NOT EXISTS memories (
                     id         INTEGER PRIMARY KEY AUTOINCREMENT,
                     content    TEXT    NOT NULL,
                     saved_at   TEXT    NOT NULL
                 )
             """)
-            conn.execute("""
+            self._conn.execute("""
                 CREATE TABLE IF NOT EXISTS reminders (
                     id          INTEGER PRIMARY KEY AUTOINCREMENT,
                     task        TEXT    NOT NULL,
@@ -45,105 +68,149 @@ class MemoryStore:
                     notified    INTEGER DEFAULT 0  -- 0=pending, 1=done
                 )
             """)
-            conn.commit()
+            # Partial index over pending reminders only: due/pending lookups
+            # become a short range scan instead of a full table scan.
+            self._conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_reminders_pending
+                    ON reminders (notified, remind_at) WHERE notified=0
+            """)
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        conn.row_factory = sqlite3.Row   # enables dict-style row access
-        return conn
+    def close(self):
+        """Close the shared connection (call once, on shutdown)."""
+        with self._lock:
+            self._conn.close()
 
     # ── Memories API ─────────────────────────────────────────
     def save_memory(self, content: str):
         """Store a new fact."""
         now = datetime.datetime.now().isoformat(timespec="seconds")
-        with self._lock, self._connect() as conn:
-            conn.execute(
-                "INSERT INTO memories (content, saved_at) VALUES (?, ?)",
+        with self._lock:
+            self._conn.execute(
+                _SQL_SAVE_MEMORY,
                 (content.strip(), now)
             )
-            conn.commit()
         print(f"[Memory] Saved: {content!r}")
 
     def get_all_memories(self) -> list[dict]:
         """Return every stored fact, newest first."""
-        with self._lock, self._connect() as conn:
-            rows = conn.execute(
-                "SELECT content, saved_at FROM memories ORDER BY id DESC"
+        with self._lock:
+            rows = self._conn.execute(
+                _SQL_ALL_MEMORIES
             ).fetchall()
         return [dict(r) for r in rows]
 
     def clear_memories(self):
         """Delete all stored memories (does NOT affect reminders)."""
-        with self._lock, self._connect() as conn:
-            conn.execute("DELETE FROM memories")
-            conn.commit()
+        with self._lock:
+            self._conn.execute(_SQL_CLEAR_MEMORIES)
 
     # ── Reminders API ─────────────────────────────────────────
     def add_reminder(self, task: str, remind_at: datetime.datetime):
         """Schedule a new reminder."""
         remind_str = remind_at.isoformat(timespec="seconds")
-        with self._lock, self._connect() as conn:
-            conn.execute(
-                "INSERT INTO reminders (task, remind_at) VALUES (?, ?)",
+        with self._lock:
+            self._conn.execute(
+                _SQL_ADD_REMINDER,
                 (task.strip(), remind_str)
             )
-            conn.commit()
+        with self.reminders_changed:
+            self.reminder_version += 1
+            self.reminders_changed.notify_all()
         print(f"[Reminder] Set: '{task}' at {remind_str}")
 
     def get_pending_reminders(self) -> list[dict]:
         """Return all un-notified reminders."""
-        with self._lock, self._connect() as conn:
-            rows = conn.execute(
-                "SELECT id, task, remind_at FROM reminders WHERE notified=0 ORDER BY remind_at"
+        with self._lock:
+            rows = self._conn.execute(
+                _SQL_PENDING_REMINDERS
             ).fetchall()
         return [dict(r) for r in rows]
 
     def get_due_reminders(self) -> list[dict]:
         """Return reminders whose time has arrived (and haven't fired yet)."""
         now = datetime.datetime.now().isoformat(timespec="seconds")
-        with self._lock, self._connect() as conn:
-            rows = conn.execute(
-                "SELECT id, task, remind_at FROM reminders WHERE notified=0 AND remind_at <= ?",
+        with self._lock:
+            rows = self._conn.execute(
+                _SQL_DUE_REMINDERS,
                 (now,)
             ).fetchall()
         return [dict(r) for r in rows]
 
     def mark_notified(self, reminder_id: int):
         """Flag a reminder as fired so it doesn't trigger again."""
-        with self._lock, self._connect() as conn:
-            conn.execute(
-                "UPDATE reminders SET notified=1 WHERE id=?", (reminder_id,)
+        with self._lock:
+            self._conn.execute(
+                _SQL_MARK_NOTIFIED, (reminder_id,)
+            )
+
+    def mark_notified_many(self, reminder_ids: list[int]):
+        """Flag several fired reminders in one UPDATE (one commit/fsync)."""
+        if not reminder_ids:
+            return
+        placeholders = ",".join("?" * len(reminder_ids))
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE reminders SET notified=1 WHERE id IN ({placeholders})", reminder_ids
             )
-            conn.commit()
 
 
 # ── Background reminder thread ────────────────────────────────
 class ReminderThread(threading.Thread):
     """
-    Runs in the background every 30 seconds, checks for due reminders,
-    and calls `callback(task_text)` when one fires.
+    Keeps pending reminders in a min-heap keyed on due time and sleeps until
+    the earliest one is due (or until a new reminder is added), then calls
+    `callback(task_text)`. With nothing pending it does not wake at all.
     """
 
+    # Upper bound on one sleep while reminders are pending, so a PC that
+    # was suspended (monotonic clock paused) still fires promptly on resume.
+    MAX_SLEEP = 60.0
+
     def __init__(self, memory: MemoryStore, callback):
         super().__init__(daemon=True)   # dies automatically when main exits
         self.memory   = memory
         self.callback = callback        # e.g. lambda text: speaker.say(text)
         self._stop_event = threading.Event()
+        self._heap    = []              # (due_timestamp, reminder_id, task)
+        self._version = None            # memory.reminder_version the heap reflects
+
+    def _reload(self):
+        """Rebuild the heap from the DB's pending reminders."""
+        self._version = self.memory.reminder_version
+        self._heap = [
+            (datetime.datetime.fromisoformat(r["remind_at"]).timestamp(), r["id"], r["task"])
+            for r in self.memory.get_pending_reminders()
+        ]
+        heapq.heapify(self._heap)
+
+    def _fire_due(self):
+        now   = time.time()
+        fired = []
+        while self._heap and self._heap[0][0] <= now:
+            _, reminder_id, task = heapq.heappop(self._heap)
+            msg = f"⏰ Reminder: {task}"
+            print(f"\n{msg}\n")
+            self.callback(msg)
+            fired.append(reminder_id)
+        self.memory.mark_notified_many(fired)
 
     def run(self):
         print("[Reminders] Background thread started ✓")
+        changed = self.memory.reminders_changed
         while not self._stop_event.is_set():
-            due = self.memory.get_due_reminders()
-            for r in due:
-                msg = f"⏰ Reminder: {r['task']}"
-                print(f"\n{msg}\n")
-                self.callback(msg)
-                self.memory.mark_notified(r["id"])
-            # Sleep in small chunks so stop_event is responsive
-            for _ in range(30):
-                if self._stop_event.is_set():
-                    break
-                self._stop_event.wait(timeout=1)
+            if self._version != self.memory.reminder_version:
+                self._reload()
+            self._fire_due()
+            with changed:
+                # Re-check under the lock so an add/stop can't slip in unseen
+                if self._stop_event.is_set() or self._version != self.memory.reminder_version:
+                    continue
+                if self._heap:
+                    changed.wait(min(max(self._heap[0][0] - time.time(), 0.0), self.MAX_SLEEP))
+                else:
+                    changed.wait()
 
     def stop(self):
         self._stop_event.set()
+        with self.memory.reminders_changed:
+            self.memory.reminders_changed.notify_all()